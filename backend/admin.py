@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Count, Sum, F
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils.safestring import mark_safe
@@ -42,6 +43,7 @@ class CustomUserAdmin(UserAdmin):
 @admin.register(Shop)
 class ShopAdmin(admin.ModelAdmin):
     list_display = ('name', 'user', 'state', 'url')
+    list_select_related = ('user',)
     list_filter = ('state',)
     search_fields = ('name', 'user__email')
     readonly_fields = ('user',)
@@ -53,14 +55,20 @@ class CategoryAdmin(admin.ModelAdmin):
     search_fields = ('name',)
     filter_horizontal = ('shops',)
 
+    def get_queryset(self, request):
+        # Считаем магазины одним запросом вместо запроса на каждую строку
+        return super().get_queryset(request).annotate(shops_total=Count('shops'))
+
     def shops_count(self, obj):
-        return obj.shops.count()
+        return obj.shops_total
     shops_count.short_description = 'Количество магазинов'
+    shops_count.admin_order_field = 'shops_total'
 
 
 @admin.register(Product)
 class ProductAdmin(admin.ModelAdmin):
     list_display = ('name', 'category')
+    list_select_related = ('category',)
     list_filter = ('category',)
     search_fields = ('name',)
 
@@ -73,6 +81,7 @@ class ProductParameterInline(admin.TabularInline):
 @admin.register(ProductInfo)
 class ProductInfoAdmin(admin.ModelAdmin):
     list_display = ('product', 'shop', 'model', 'price', 'quantity')
+    list_select_related = ('product', 'shop')
     list_filter = ('shop', 'product__category')
     search_fields = ('product__name', 'model')
     readonly_fields = ('external_id',)
@@ -100,6 +109,7 @@ class OrderItemInline(admin.TabularInline):
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
     list_display = ('id', 'user', 'dt', 'state', 'total_sum_display', 'contact')
+    list_select_related = ('user', 'contact')
     list_filter = ('state', 'dt')
     search_fields = ('user__email', 'user__first_name', 'user__last_name')
     readonly_fields = ('dt', 'total_sum_display')
@@ -107,9 +117,16 @@ class OrderAdmin(admin.ModelAdmin):
 
     actions = ['mark_confirmed', 'mark_assembled', 'mark_sent', 'mark_delivered']
 
+    def get_queryset(self, request):
+        # Сумму заказа считаем в общем запросе, а не агрегатом на каждую строку
+        return super().get_queryset(request).annotate(
+            total_amount_sum=Sum(F('ordered_items__quantity') * F('ordered_items__product_info__price'))
+        )
+
     def total_sum_display(self, obj):
-        return f"{obj.total_sum} руб."
+        return f"{obj.total_amount_sum or 0} руб."
     total_sum_display.short_description = 'Общая сумма'
+    total_sum_display.admin_order_field = 'total_amount_sum'
 
     def mark_confirmed(self, request, queryset):
         queryset.update(state='confirmed')
@@ -135,6 +152,7 @@ class OrderAdmin(admin.ModelAdmin):
 @admin.register(OrderItem)
 class OrderItemAdmin(admin.ModelAdmin):
     list_display = ('order', 'product_info', 'quantity', 'total_amount')
+    list_select_related = ('order', 'product_info__product', 'product_info__shop')
     list_filter = ('order__state',)
 
     def total_amount(self, obj):
@@ -145,6 +163,7 @@ class OrderItemAdmin(admin.ModelAdmin):
 @admin.register(Contact)
 class ContactAdmin(admin.ModelAdmin):
     list_display = ('user', 'city', 'street', 'phone')
+    list_select_related = ('user',)
     search_fields = ('user__email', 'city', 'street', 'phone')
     list_filter = ('city',)
 
@@ -152,5 +171,6 @@ class ContactAdmin(admin.ModelAdmin):
 @admin.register(ConfirmEmailToken)
 class ConfirmEmailTokenAdmin(admin.ModelAdmin):
     list_display = ('user', 'key', 'created_at')
+    list_select_related = ('user',)
     readonly_fields = ('key', 'created_at')
     search_fields = ('user__email',)
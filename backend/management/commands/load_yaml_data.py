@@ -108,13 +108,16 @@ class Command(BaseCommand):
                     )
                     products_created += 1
 
+                    # Параметры товара вставляем одним запросом
+                    product_parameters = []
                     for pname, pval in item.get('parameters', {}).items():
                         parameter, _ = Parameter.objects.get_or_create(name=pname)
-                        ProductParameter.objects.create(
+                        product_parameters.append(ProductParameter(
                             product_info=info,
                             parameter=parameter,
                             value=str(pval)
-                        )
+                        ))
+                    ProductParameter.objects.bulk_create(product_parameters)
 
                 self.stdout.write(self.style.SUCCESS(
                     f'Загружено: {categories_created} категорий, {products_created} товаров'
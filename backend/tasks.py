@@ -158,16 +158,18 @@ def import_shop_data_task(url, user_id):
                     )
                     products_created += 1
 
-                    # Создаем параметры товара
+                    # Создаем параметры товара одним запросом
                     if 'parameters' in item:
+                        product_parameters = []
                         for param_name, param_value in item['parameters'].items():
                             parameter, _ = Parameter.objects.get_or_create(name=param_name)
-                            ProductParameter.objects.create(
+                            product_parameters.append(ProductParameter(
                                 product_info_id=product_info.id,
                                 parameter_id=parameter.id,
                                 value=str(param_value)
-                            )
-                            parameters_created += 1
+                            ))
+                        ProductParameter.objects.bulk_create(product_parameters)
+                        parameters_created += len(product_parameters)
 
                 except Exception as e:
                     logger.error(f"Error processing item {item.get('id')}: {str(e)}")
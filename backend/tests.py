@@ -1,3 +1,301 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from backend.models import (
+    User, Shop, Category, Product, ProductInfo, Parameter,
+    ProductParameter, Order, OrderItem, Contact
+)
+
+
+def create_product_info(shop, category, number, price=100):
+    """Создаёт товар магазина с одним параметром"""
+    product = Product.objects.create(name=f'Товар {number}', category=category)
+    product_info = ProductInfo.objects.create(
+        product=product, shop=shop, external_id=number,
+        model=f'model-{number}', quantity=10, price=price, price_rrc=price + 10
+    )
+    parameter, _ = Parameter.objects.get_or_create(name='Цвет')
+    ProductParameter.objects.create(product_info=product_info, parameter=parameter, value='черный')
+    return product_info
+
+
+class OrderFixtureMixin:
+    """Магазин с товарами, покупатель и его контакт"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.shop_user = User.objects.create_user(
+            email='shop@example.com', password='TestPass123', type='shop', is_active=True
+        )
+        cls.shop = Shop.objects.create(name='Магазин', user=cls.shop_user, state=True)
+        cls.category = Category.objects.create(name='Смартфоны')
+        cls.buyer = User.objects.create_user(
+            email='buyer@example.com', password='TestPass123', is_active=True
+        )
+        cls.contact = Contact.objects.create(
+            user=cls.buyer, city='Москва', street='Тверская', phone='+79000000000'
+        )
+
+    def create_order(self, number, quantity=2, price=100):
+        """Создаёт оформленный заказ покупателя с одной позицией"""
+        product_info = create_product_info(self.shop, self.category, number, price)
+        order = Order.objects.create(user=self.buyer, state='new', contact=self.contact)
+        OrderItem.objects.create(order=order, product_info=product_info, quantity=quantity)
+        return order
+
+
+class OrderViewTests(OrderFixtureMixin, APITestCase):
+    """Список заказов покупателя"""
+
+    def setUp(self):
+        self.url = reverse('backend:order')
+        self.client.force_authenticate(user=self.buyer)
+
+    def test_get_orders_list(self):
+        order = self.create_order(1, quantity=3, price=150)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['id'], order.id)
+        self.assertEqual(response.data[0]['total'], 450)
+
+    def test_query_count_does_not_depend_on_orders(self):
+        orders = [self.create_order(number, quantity=number, price=100) for number in range(1, 6)]
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        totals = {order['id']: order['total'] for order in response.data}
+        self.assertEqual(totals, {order.id: index * 100 for index, order in enumerate(orders, start=1)})
+
+
+class PartnerOrdersTests(OrderFixtureMixin, APITestCase):
+    """Список заказов поставщика"""
+
+    def setUp(self):
+        self.url = reverse('backend:partner-orders')
+        self.client.force_authenticate(user=self.shop_user)
+
+    def test_get_partner_orders(self):
+        order = self.create_order(1, quantity=2, price=250)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['id'], order.id)
+        self.assertEqual(response.data[0]['total'], 500)
+
+    def test_query_count_does_not_depend_on_orders(self):
+        orders = [self.create_order(number, quantity=number, price=100) for number in range(1, 6)]
+
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        totals = {order['id']: order['total'] for order in response.data}
+        self.assertEqual(totals, {order.id: index * 100 for index, order in enumerate(orders, start=1)})
+
+    def test_buyer_forbidden(self):
+        self.client.force_authenticate(user=self.buyer)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ProductInfoViewTests(APITestCase):
+    """Каталог товаров"""
+
+    @classmethod
+    def setUpTestData(cls):
+        shop_user = User.objects.create_user(
+            email='shop@example.com', password='TestPass123', type='shop', is_active=True
+        )
+        cls.shop = Shop.objects.create(name='Магазин', user=shop_user, state=True)
+        cls.category = Category.objects.create(name='Смартфоны')
+        cls.url = reverse('backend:products')
+
+    def test_get_products(self):
+        product_info = create_product_info(self.shop, self.category, 1, price=150)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['id'], product_info.id)
+        self.assertEqual(response.data[0]['product']['category'], 'Смартфоны')
+        self.assertEqual(response.data[0]['product_parameters'][0]['parameter'], 'Цвет')
+
+    def test_query_count_does_not_depend_on_products(self):
+        for number in range(1, 7):
+            create_product_info(self.shop, self.category, number)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'category_id': self.category.id})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 6)
+
+
+class AdminChangelistTests(OrderFixtureMixin, TestCase):
+    """Списки заказов и категорий в админке"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin = User.objects.create_superuser(email='admin@example.com', password='TestPass123')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def get_changelist(self, url, params=None):
+        """Открывает список в админке и возвращает ответ и число запросов"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def create_shop(self, number):
+        user = User.objects.create_user(
+            email=f'shop{number}@example.com', password='TestPass123', type='shop', is_active=True
+        )
+        return Shop.objects.create(name=f'Магазин {number}', user=user)
+
+    def test_order_changelist_query_count(self):
+        url = reverse('admin:backend_order_changelist')
+        self.create_order(1)
+        _, single_count = self.get_changelist(url)
+
+        for number in range(2, 6):
+            self.create_order(number)
+        _, many_count = self.get_changelist(url)
+
+        self.assertEqual(single_count, many_count)
+
+    def test_order_total_sum_display(self):
+        order = self.create_order(1, quantity=3, price=150)
+        response, _ = self.get_changelist(reverse('admin:backend_order_changelist'))
+
+        self.assertEqual(response.context['cl'].result_list[0].id, order.id)
+        self.assertContains(response, '<td class="field-total_sum_display">450 руб.</td>', html=True)
+
+    def test_order_sort_by_total(self):
+        cheap = self.create_order(1, quantity=1, price=100)
+        expensive = self.create_order(2, quantity=5, price=100)
+        middle = self.create_order(3, quantity=2, price=100)
+        url = reverse('admin:backend_order_changelist')
+
+        response, _ = self.get_changelist(url, {'o': '5'})
+        self.assertEqual([order.id for order in response.context['cl'].result_list],
+                         [cheap.id, middle.id, expensive.id])
+
+        response, _ = self.get_changelist(url, {'o': '-5'})
+        self.assertEqual([order.id for order in response.context['cl'].result_list],
+                         [expensive.id, middle.id, cheap.id])
+
+    def test_category_changelist_query_count(self):
+        url = reverse('admin:backend_category_changelist')
+        self.category.shops.add(self.shop)
+        _, single_count = self.get_changelist(url)
+
+        for number in range(1, 5):
+            category = Category.objects.create(name=f'Категория {number}')
+            category.shops.add(self.shop, self.create_shop(number))
+        _, many_count = self.get_changelist(url)
+
+        self.assertEqual(single_count, many_count)
+
+    def test_category_shops_count_and_sort(self):
+        empty = Category.objects.create(name='Пустая')
+        self.category.shops.add(self.shop, self.create_shop(1), self.create_shop(2))
+        single = Category.objects.create(name='Аксессуары')
+        single.shops.add(self.shop)
+        url = reverse('admin:backend_category_changelist')
+
+        response, _ = self.get_changelist(url, {'o': '2'})
+        categories = list(response.context['cl'].result_list)
+        self.assertEqual([category.id for category in categories], [empty.id, single.id, self.category.id])
+        self.assertEqual([category.shops_total for category in categories], [0, 1, 3])
+        self.assertContains(response, '<td class="field-shops_count">3</td>', html=True)
+
+        response, _ = self.get_changelist(url, {'o': '-2'})
+        self.assertEqual([category.id for category in response.context['cl'].result_list],
+                         [self.category.id, single.id, empty.id])
+
+
+class BasketViewTests(OrderFixtureMixin, APITestCase):
+    """Добавление и изменение позиций корзины"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.product_info = create_product_info(cls.shop, cls.category, 1)
+        cls.url = reverse('backend:basket')
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.buyer)
+
+    def assert_item_added(self, response, quantity=2):
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['Создано объектов'], 1)
+        order_item = OrderItem.objects.get(order__user=self.buyer, order__state='basket')
+        self.assertEqual(order_item.product_info, self.product_info)
+        self.assertEqual(order_item.quantity, quantity)
+
+    def test_post_json_list(self):
+        response = self.client.post(
+            self.url, {'items': [{'product_info': self.product_info.id, 'quantity': 2}]}, format='json'
+        )
+
+        self.assert_item_added(response)
+
+    def test_post_json_string(self):
+        response = self.client.post(
+            self.url, {'items': f'[{{"product_info": {self.product_info.id}, "quantity": 2}}]'},
+            format='json'
+        )
+
+        self.assert_item_added(response)
+
+    def test_post_form_string(self):
+        response = self.client.post(
+            self.url, {'items': f'[{{"product_info": {self.product_info.id}, "quantity": 2}}]'},
+            format='multipart'
+        )
+
+        self.assert_item_added(response)
+
+    def test_put_json_list(self):
+        basket = Order.objects.create(user=self.buyer, state='basket')
+        order_item = OrderItem.objects.create(order=basket, product_info=self.product_info, quantity=1)
+
+        response = self.client.put(
+            self.url, {'items': [{'id': order_item.id, 'quantity': 5}]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['Обновлено объектов'], 1)
+        order_item.refresh_from_db()
+        self.assertEqual(order_item.quantity, 5)
+
+    def test_invalid_items(self):
+        for items in ({'product_info': 1}, 5, [1], '{"a": 1}', 'not json'):
+            for method in (self.client.post, self.client.put):
+                with self.subTest(items=items, method=method.__name__):
+                    response = method(self.url, {'items': items}, format='json')
+
+                    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                    self.assertEqual(response.data['Errors'], 'Неверный формат запроса')
+
+        self.assertFalse(OrderItem.objects.exists())
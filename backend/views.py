@@ -3,7 +3,7 @@ from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 from django.db import IntegrityError
-from django.db.models import Q, Sum, F
+from django.db.models import Q, Sum, F, Prefetch
 from django.http import JsonResponse
 from rest_framework.authtoken.models import Token
 from rest_framework.generics import ListAPIView
@@ -90,7 +90,7 @@ class ConfirmAccount(APIView):
             token = ConfirmEmailToken.objects.filter(
                 user__email=request.data['email'],
                 key=request.data['token']
-            ).first()
+            ).select_related('user').first()
 
             if token:
                 token.user.is_active = True
@@ -221,7 +221,7 @@ class ProductInfoView(APIView):
         queryset = ProductInfo.objects.filter(query).select_related(
             'shop', 'product__category'
         ).prefetch_related(
-            'product_parameters__parameter'
+            Prefetch('product_parameters', queryset=ProductParameter.objects.select_related('parameter'))
         ).distinct()
 
         serializer = ProductInfoSerializer(queryset, many=True)
@@ -234,6 +234,16 @@ class BasketView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
+    @staticmethod
+    def _parse_items(items):
+        """Разобрать список позиций корзины, ValueError при неверном формате"""
+        # Список приходит строкой JSON (form-data) или готовым списком (JSON-тело)
+        items_list = load_json(items) if isinstance(items, str) else items
+        if not (isinstance(items_list, list) and
+                all(isinstance(order_item, dict) for order_item in items_list)):
+            raise ValueError('items должен быть списком объектов')
+        return items_list
+
     def get(self, request, *args, **kwargs):
         """Получить содержимое корзины"""
 
@@ -241,8 +251,11 @@ class BasketView(APIView):
             user_id=request.user.id,
             state='basket'
         ).prefetch_related(
-            'ordered_items__product_info__product__category',
-            'ordered_items__product_info__product_parameters__parameter'
+            Prefetch('ordered_items', queryset=OrderItem.objects.select_related(
+                'product_info__product__category'
+            )),
+            Prefetch('ordered_items__product_info__product_parameters',
+                     queryset=ProductParameter.objects.select_related('parameter'))
         ).annotate(
             total=Sum(F('ordered_items__quantity') * F('ordered_items__product_info__price'))
         ).distinct()
@@ -253,10 +266,10 @@ class BasketView(APIView):
     def post(self, request, *args, **kwargs):
         """Добавить товары в корзину"""
 
-        items_string = request.data.get('items')
-        if items_string:
+        items = request.data.get('items')
+        if items:
             try:
-                items_dict = load_json(items_string)
+                items_dict = self._parse_items(items)
             except ValueError:
                 return Response({
                     'Status': False,
@@ -302,10 +315,10 @@ class BasketView(APIView):
     def put(self, request, *args, **kwargs):
         """Обновить количество товаров в корзине"""
 
-        items_string = request.data.get('items')
-        if items_string:
+        items = request.data.get('items')
+        if items:
             try:
-                items_dict = load_json(items_string)
+                items_dict = self._parse_items(items)
             except ValueError:
                 return Response({
                     'Status': False,
@@ -473,8 +486,11 @@ class OrderView(APIView):
         order = Order.objects.filter(
             user_id=request.user.id,
         ).exclude(state='basket').prefetch_related(
-            'ordered_items__product_info__product__category',
-            'ordered_items__product_info__product_parameters__parameter'
+            Prefetch('ordered_items', queryset=OrderItem.objects.select_related(
+                'product_info__product__category'
+            )),
+            Prefetch('ordered_items__product_info__product_parameters',
+                     queryset=ProductParameter.objects.select_related('parameter'))
         ).select_related('contact').annotate(
             total=Sum(F('ordered_items__quantity') * F('ordered_items__product_info__price'))
         ).distinct()
@@ -629,10 +645,13 @@ class PartnerOrders(APIView):
         order = Order.objects.filter(
             ordered_items__product_info__shop__user_id=request.user.id
         ).exclude(state='basket').prefetch_related(
-            'ordered_items__product_info__product__category',
-            'ordered_items__product_info__product_parameters__parameter'
+            Prefetch('ordered_items', queryset=OrderItem.objects.select_related(
+                'product_info__product__category'
+            )),
+            Prefetch('ordered_items__product_info__product_parameters',
+                     queryset=ProductParameter.objects.select_related('parameter'))
         ).select_related('contact').annotate(
-            total_sum=Sum(F('ordered_items__quantity') * F('ordered_items__product_info__price'))
+            total=Sum(F('ordered_items__quantity') * F('ordered_items__product_info__price'))
         ).distinct()
 
         serializer = OrderSerializer(order, many=True)
@@ -660,7 +679,7 @@ class OrderStatusUpdateView(APIView):
 
         if order_id and new_state:
             try:
-                order = get_object_or_404(Order, id=order_id)
+                order = get_object_or_404(Order.objects.select_related('user'), id=order_id)
                 old_state = order.state
                 order.state = new_state
                 order.save()